@@ -1,5 +1,7 @@
 
 from typing import Tuple
+import functools
+import hashlib
 import math
 from html import escape
 import textwrap
@@ -40,6 +42,58 @@ EXPECTED_COL = "Expected Value ($)"
 TERM_COL = "Term (years)"
 INTEREST_COL = "Interest"
 
+STAGE_FLAG_COLS = ["Lead", "Prospect", "Under 50%", "50-75%", "Over 75%", "Contracted", "Dead"]
+
+# Declared dtypes for the prospect sheets so pd.read_excel skips inference on
+# the label/flag columns. The money/probability columns are deliberately NOT
+# declared: a float64 read dtype makes xls.parse raise on textual junk in a
+# numeric cell ("TBD", "N/A"), whereas the post-read cleanup coerces it to 0.0.
+PROSPECT_DTYPES = {
+    "Prospect ID": "string",
+    "Prospect (Account Name)": "string",
+    "Owner": "string",
+    "Interest": "string",
+    **{col: "string" for col in STAGE_FLAG_COLS},
+}
+
+# Numeric columns the app consumes, including every alias label the coalescing
+# below understands; read with inferred dtypes, cleaned after the read.
+PROSPECT_NUMERIC_USECOLS = [
+    "Current Proposed Investment",
+    "Projected Annual Revenue ($)",
+    "Projected Annual Value ($)",
+    "Contracted Annual Revenue ($)",
+    "Contracted Annual Value ($)",
+    "Probability (%)",
+    "Expected Value ($)",
+    "Term (years)",
+]
+
+PROSPECT_USECOLS = frozenset(PROSPECT_DTYPES) | frozenset(PROSPECT_NUMERIC_USECOLS)
+
+CONTACT_DTYPES = {
+    "Prospect (Account Name)": "string",
+    "Prospect (Sponsorship/Public)": "string",
+    "Contact Type (email/phone/zoom/in-person)": "string",
+    "Contact Owner": "string",
+    "Contact Name": "string",
+    "Outcome (left VM/spoke/meeting set/sent deck/etc.)": "string",
+    "Next Step": "string",
+}
+CONTACT_DATE_COLS = ["Contact Date", "Follow-up Date"]
+
+
+def _prospect_usecols(col) -> bool:
+    name = str(col).strip()
+    # Keep anything BizX-ish so the closed-row fallback can still find it.
+    return name in PROSPECT_USECOLS or "bizx" in name.lower()
+
+
+def _contact_usecols(col) -> bool:
+    name = str(col).strip()
+    return name in CONTACT_DTYPES or name in CONTACT_DATE_COLS
+
+
 STAGE_ORDER = ["Lead", "Under 50%", "50-75%", "Over 75%", "Contracted"]
 TOTALS_STAGE_ORDER = ["Under 50%", "50-75%", "Over 75%", "Contracted"]
 
@@ -548,10 +602,9 @@ def nice_ceiling(value: float) -> float:
     return math.ceil(value / step) * step
 
 
-def _normalize_partner_type(val: str):
-    if pd.isna(val):
-        return None
-    s = str(val).strip().lower()
+@functools.lru_cache(maxsize=256)
+def _normalize_partner_type_cached(raw: str):
+    s = raw.strip().lower()
     if not s:
         return None
     if s.startswith("sponsor"):
@@ -561,11 +614,55 @@ def _normalize_partner_type(val: str):
     return None
 
 
+def _normalize_partner_type(val: str):
+    # Partner-type inputs repeat a handful of spellings, so memoizing the
+    # normalization collapses column-wide use to dict lookups. NaN stays
+    # outside the cache because it is unhashable-by-meaning, not by type.
+    if pd.isna(val):
+        return None
+    return _normalize_partner_type_cached(str(val))
+
+
+_FLAG_VALUES = frozenset({"x", "1", "true", "yes", "y"})
+
+
+@functools.lru_cache(maxsize=256)
+def _is_flag_cached(raw: str) -> bool:
+    return raw.strip().lower() in _FLAG_VALUES
+
+
 def _is_flag(val) -> bool:
     if pd.isna(val):
         return False
-    s = str(val).strip().lower()
-    return s in ("x", "1", "true", "yes", "y")
+    return _is_flag_cached(str(val))
+
+
+def _flag_mask(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Vectorized `_is_flag` over a whole column; missing columns match nothing."""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    normalized = df[col].astype("string").str.strip().str.lower()
+    return normalized.isin(_FLAG_VALUES).fillna(False).to_numpy(dtype=bool)
+
+
+def _concat_prospect_frames(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+    """Stack the two prospect sheets column-by-column with np.concatenate.
+
+    Avoids the pd.concat block-consolidation path: each shared column is a
+    single array concatenation, and columns present in only one sheet are
+    padded with NaN on the other side.
+    """
+    all_cols = left.columns.union(right.columns, sort=False)
+    data = {
+        col: np.concatenate(
+            [
+                frame[col].to_numpy() if col in frame.columns else np.full(len(frame), np.nan)
+                for frame in (left, right)
+            ]
+        )
+        for col in all_cols
+    }
+    return pd.DataFrame(data, copy=False)
 
 
 def _coalesce_column(df: pd.DataFrame, aliases: list[str], target: str) -> pd.DataFrame:
@@ -710,7 +807,7 @@ def _extract_bizx_details(raw_df: pd.DataFrame) -> pd.DataFrame:
         brand_col = df.columns[0]
 
     if active_col is not None:
-        df = df[df[active_col].apply(_is_flag)].copy()
+        df = df[_flag_mask(df, active_col)].copy()
 
     rows = []
     for _, row in df.iterrows():
@@ -759,7 +856,7 @@ def _extract_bizx_details_from_closed_rows(closed_df: pd.DataFrame) -> pd.DataFr
         mask = mask | sponsorship_df[INTEREST_COL].astype(str).str.contains("bizx", case=False, na=False)
 
     for col in bizx_flag_cols:
-        mask = mask | sponsorship_df[col].apply(_is_flag)
+        mask = mask | _flag_mask(sponsorship_df, col)
 
     bizx_rows = sponsorship_df[mask].copy()
     if bizx_rows.empty:
@@ -844,27 +941,35 @@ def _build_bizx_details_html(bizx_details: pd.DataFrame) -> str:
 # Data loading
 # -------------------------------------------------------------------
 
-def load_workbook(xlsx_file) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str], pd.DataFrame]:
+@st.cache_data(show_spinner=False, hash_funcs={"builtins.bytes": lambda b: hashlib.sha1(b).hexdigest()})
+def load_workbook(file_bytes: bytes) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str], pd.DataFrame]:
     try:
-        if hasattr(xlsx_file, "seek"):
-            xlsx_file.seek(0)
-        xls = pd.ExcelFile(xlsx_file)
-        sponsorships = pd.read_excel(xls, sheet_name=SPONSORSHIP_SHEET)
-        public = pd.read_excel(xls, sheet_name=PUBLIC_INVESTMENT_SHEET)
-        contacts = pd.read_excel(xls, sheet_name=CONTACT_DETAIL_SHEET)
-        data_dict = pd.read_excel(xls, sheet_name=DATA_DICTIONARY_SHEET)
-
-        if KEY_CONVERSATIONS_SHEET in xls.sheet_names:
-            key_conversation_df = pd.read_excel(xls, sheet_name=KEY_CONVERSATIONS_SHEET)
-            key_conversations = _extract_key_conversation_brands(key_conversation_df)
-        else:
-            key_conversations = []
-
-        bizx_details = pd.DataFrame(columns=[BIZX_BRAND_COL, BIZX_DETAIL_COL, BIZX_AMOUNT_COL])
-        for sheet_name in BIZX_DETAILS_SHEET_ALIASES:
-            if sheet_name in xls.sheet_names:
-                bizx_details = _extract_bizx_details(pd.read_excel(xls, sheet_name=sheet_name))
-                break
+        # Parse the OOXML container once and reuse the handle for every sheet;
+        # xls.parse skips the per-call engine setup that read_excel repeats.
+        with pd.ExcelFile(io.BytesIO(file_bytes), engine="openpyxl") as xls:
+            sponsorships = xls.parse(SPONSORSHIP_SHEET, dtype=PROSPECT_DTYPES, usecols=_prospect_usecols)
+            public = xls.parse(PUBLIC_INVESTMENT_SHEET, dtype=PROSPECT_DTYPES, usecols=_prospect_usecols)
+            # Contact Date is required downstream, so parsing it at read time is
+            # safe; Follow-up Date is optional and stays with the post-read loop.
+            contacts = xls.parse(
+                CONTACT_DETAIL_SHEET,
+                dtype=CONTACT_DTYPES,
+                usecols=_contact_usecols,
+                parse_dates=["Contact Date"],
+            )
+            data_dict = xls.parse(DATA_DICTIONARY_SHEET)
+
+            if KEY_CONVERSATIONS_SHEET in xls.sheet_names:
+                key_conversation_df = xls.parse(KEY_CONVERSATIONS_SHEET)
+                key_conversations = _extract_key_conversation_brands(key_conversation_df)
+            else:
+                key_conversations = []
+
+            bizx_details = pd.DataFrame(columns=[BIZX_BRAND_COL, BIZX_DETAIL_COL, BIZX_AMOUNT_COL])
+            for sheet_name in BIZX_DETAILS_SHEET_ALIASES:
+                if sheet_name in xls.sheet_names:
+                    bizx_details = _extract_bizx_details(xls.parse(sheet_name))
+                    break
     except Exception as e:
         st.error("There was a problem reading one or more sheets from the workbook.")
         st.exception(e)
@@ -908,7 +1013,7 @@ def load_workbook(xlsx_file) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame,
     sponsorships[PARTNER_TYPE_COL] = "Sponsorship"
     public[PARTNER_TYPE_COL] = "Public Investment"
 
-    prospects = pd.concat([sponsorships, public], ignore_index=True)
+    prospects = _concat_prospect_frames(sponsorships, public)
 
     for col in ["Prospect ID", "Prospect (Account Name)"]:
         if col not in prospects.columns:
@@ -927,60 +1032,72 @@ def load_workbook(xlsx_file) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame,
         TERM_COL,
     ]
     for col in numeric_cols:
-        if col in prospects.columns:
-            prospects[col] = pd.to_numeric(prospects[col], errors="coerce").fillna(0.0)
-        else:
+        if col not in prospects.columns:
             prospects[col] = 0.0
+        elif prospects[col].dtype.kind == "f":
+            # Clean sheets infer straight to float at read time; only fill
+            # NaNs, and only when there are any to fill.
+            arr = prospects[col].to_numpy(dtype=float)
+            nan_mask = np.isnan(arr)
+            if nan_mask.any():
+                arr = arr.copy()
+                arr[nan_mask] = 0.0
+                prospects[col] = arr
+        else:
+            # Columns with textual junk arrive as objects: coerce and
+            # zero-fill in one pass over a writable copy of the array.
+            arr = pd.to_numeric(prospects[col], errors="coerce").to_numpy(dtype=float, copy=True)
+            arr[np.isnan(arr)] = 0.0
+            prospects[col] = arr
+
+    # Decide the 0-1 vs 0-100 probability scale from one pass over the raw
+    # ndarray, and only write back when a rescale is actually needed.
+    probs = prospects[PROBABILITY_COL].to_numpy(dtype=float)
+    if probs.size and probs.max() <= 1.0:
+        prospects[PROBABILITY_COL] = probs * 100.0
+
+    # Stage bucket, built with vectorized masks applied in reverse priority:
+    # stage-flag fallback first, then probability, then contracted, then dead,
+    # so the higher-priority assignments overwrite the lower ones.
+    buckets = np.full(len(prospects), "Lead", dtype=object)
+
+    # Normalize each flag column exactly once; every later step reads the
+    # precomputed bool arrays instead of re-running the string pass.
+    flag_masks = {col: _flag_mask(prospects, col) for col in STAGE_FLAG_COLS}
+
+    stage_cols_map = {
+        "Lead": "Lead",
+        "Prospect": "Lead",
+        "Under 50%": "Under 50%",
+        "50-75%": "50-75%",
+        "Over 75%": "Over 75%",
+    }
+    # Reversed so the first matching flag column wins, as in a first-match scan.
+    for col, bucket in reversed(list(stage_cols_map.items())):
+        buckets[flag_masks[col]] = bucket
+
+    p = prospects[PROBABILITY_COL].to_numpy(dtype=float)
+    has_prob = ~np.isnan(p)
+    prob_buckets = np.select(
+        [p == 0, p < 50, p < 75, p < 100],
+        ["Lead", "Under 50%", "50-75%", "Over 75%"],
+        default="Contracted",
+    )
+    buckets[has_prob] = prob_buckets[has_prob]
 
-    if PROBABILITY_COL in prospects.columns and not prospects[PROBABILITY_COL].isna().all():
-        max_prob = prospects[PROBABILITY_COL].max()
-        if max_prob <= 1.0:
-            prospects[PROBABILITY_COL] = prospects[PROBABILITY_COL] * 100.0
-
-    def _compute_stage_bucket(row: pd.Series) -> str:
-        if "Dead" in row and _is_flag(row["Dead"]):
-            return "Dead"
-
-        contracted_rev = row.get(CONTRACTED_COL, 0.0)
-        try:
-            contracted_rev = float(contracted_rev)
-        except (TypeError, ValueError):
-            contracted_rev = 0.0
-
-        if ("Contracted" in row and _is_flag(row["Contracted"])) or contracted_rev > 0:
-            return "Contracted"
-
-        p_raw = row.get(PROBABILITY_COL)
-        try:
-            p = float(p_raw)
-        except (TypeError, ValueError):
-            p = float("nan")
-
-        if not math.isnan(p):
-            if p == 0:
-                return "Lead"
-            if p < 50:
-                return "Under 50%"
-            if p < 75:
-                return "50-75%"
-            if p < 100:
-                return "Over 75%"
-            return "Contracted"
-
-        stage_cols_map = {
-            "Lead": "Lead",
-            "Prospect": "Lead",
-            "Under 50%": "Under 50%",
-            "50-75%": "50-75%",
-            "Over 75%": "Over 75%",
-        }
-        for col, bucket in stage_cols_map.items():
-            if col in row and _is_flag(row[col]):
-                return bucket
+    contracted_rev = prospects[CONTRACTED_COL].to_numpy(dtype=float)
+    buckets[flag_masks["Contracted"] | (contracted_rev > 0)] = "Contracted"
+    buckets[flag_masks["Dead"]] = "Dead"
 
-        return "Lead"
+    prospects["Stage Bucket"] = pd.Categorical(buckets, categories=STAGE_ORDER + ["Dead"], ordered=True)
 
-    prospects["Stage Bucket"] = prospects.apply(_compute_stage_bucket, axis=1)
+    # Low-cardinality label columns become categoricals so the per-render
+    # ==/isin masks and groupbys compare int8 codes instead of strings.
+    prospects[PARTNER_TYPE_COL] = pd.Categorical(
+        prospects[PARTNER_TYPE_COL], categories=["Sponsorship", "Public Investment"]
+    )
+    if "Owner" in prospects.columns:
+        prospects["Owner"] = prospects["Owner"].astype("category")
 
     if INTEREST_COL not in prospects.columns:
         prospects[INTEREST_COL] = ""
@@ -997,13 +1114,35 @@ def load_workbook(xlsx_file) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame,
         subset=["Prospect (Account Name)", "Contact Date"], how="all"
     ).copy()
 
-    for col in ["Contact Date", "Follow-up Date"]:
-        if col in contacts.columns:
-            contacts[col] = pd.to_datetime(contacts[col], errors="coerce")
+    # Contact Date is already datetime from parse_dates at read time; only
+    # convert what is left. cache=True reuses parses for repeated timestamps,
+    # which contact logs are full of.
+    for col in CONTACT_DATE_COLS:
+        if col in contacts.columns and not pd.api.types.is_datetime64_any_dtype(contacts[col]):
+            contacts[col] = pd.to_datetime(contacts[col], errors="coerce", cache=True)
 
     return prospects, contacts, data_dict, key_conversations, bizx_details
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _apply_filters(
+    _prospects: pd.DataFrame,
+    cache_key: str,
+    partner_types: tuple[str, ...],
+    owners: tuple[str, ...] | None,
+) -> pd.DataFrame:
+    """Sidebar filter application, cached per (workbook, selection) pair.
+
+    `_prospects` is excluded from Streamlit's hash (leading underscore); the
+    workbook digest in `cache_key` identifies its contents instead, so repeat
+    visits to a filter combination are a cache lookup rather than mask work.
+    """
+    mask = _prospects[PARTNER_TYPE_COL].isin(partner_types)
+    if owners is not None:
+        mask &= _prospects["Owner"].isin(owners)
+    return _prospects.loc[mask]
+
+
 def _display_closed_business_brand_name(name: str) -> str:
     clean_name = str(name or "").strip()
     return CLOSED_BUSINESS_DISPLAY_NAMES.get(clean_name, clean_name)
@@ -1212,11 +1351,14 @@ def build_key_conversations_section(key_conversations: list[str]) -> None:
 def build_snapshot_section(prospects: pd.DataFrame) -> None:
     st.markdown('<div class="dashboard-section-title">Total Pipeline Snapshot</div>', unsafe_allow_html=True)
 
-    active_df = prospects[prospects["Stage Bucket"] != "Dead"].copy()
+    active_df = prospects.loc[prospects["Stage Bucket"] != "Dead"]
 
-    total_expected = active_df[EXPECTED_COL].sum()
-    total_current = active_df[CURRENT_INVESTMENT_COL].sum()
-    total_contracted = active_df[CONTRACTED_COL].sum()
+    # One aggregation pass over the money columns instead of three separate
+    # column sums; the numeric cleanup guarantees all three exist.
+    totals = active_df[[CURRENT_INVESTMENT_COL, EXPECTED_COL, CONTRACTED_COL]].sum()
+    total_current = totals[CURRENT_INVESTMENT_COL]
+    total_expected = totals[EXPECTED_COL]
+    total_contracted = totals[CONTRACTED_COL]
     deal_count = active_df["Prospect ID"].nunique()
 
     cards = [
@@ -1241,29 +1383,36 @@ def build_snapshot_section(prospects: pd.DataFrame) -> None:
             )
 
 
-def build_pipeline_totals(prospects: pd.DataFrame) -> None:
+@st.cache_data(show_spinner=False, max_entries=32)
+def _stage_type_agg(_df: pd.DataFrame, cache_key) -> pd.DataFrame:
+    """Stage/type aggregate for the totals section, cached on the filter key."""
+    return (
+        _df.groupby(["Stage Bucket", PARTNER_TYPE_COL], as_index=False, observed=True, sort=False)
+        .agg(
+            expected_total=(EXPECTED_COL, "sum"),
+            deal_count=("Prospect ID", "nunique"),
+        )
+    )
+
+
+def build_pipeline_totals(prospects: pd.DataFrame, cache_key) -> None:
     st.markdown('<div class="dashboard-section-title">Total Pipeline Value by Stage</div>', unsafe_allow_html=True)
     st.markdown(
         '<div class="dashboard-section-subtitle">Expected value only. Lead deals are intentionally excluded for a cleaner pipeline view.</div>',
         unsafe_allow_html=True,
     )
 
-    df = prospects[
+    # Read-only view; no copy needed for the groupby below.
+    df = prospects.loc[
         (prospects["Stage Bucket"] != "Dead")
         & (prospects["Stage Bucket"].isin(TOTALS_STAGE_ORDER))
-    ].copy()
+    ]
 
     if df.empty:
         st.caption("No active pipeline data for the selected filters.")
         return
 
-    agg = (
-        df.groupby(["Stage Bucket", PARTNER_TYPE_COL], as_index=False)
-        .agg(
-            expected_total=(EXPECTED_COL, "sum"),
-            deal_count=("Prospect ID", "nunique"),
-        )
-    )
+    agg = _stage_type_agg(df, cache_key)
 
     chart = (
         alt.Chart(agg)
@@ -1419,19 +1568,20 @@ def _render_deal_panel(data: pd.DataFrame, title: str) -> None:
 def build_top_deals(prospects: pd.DataFrame) -> None:
     st.markdown('<div class="dashboard-section-title">Top 15 Deals by Expected Value</div>', unsafe_allow_html=True)
 
-    def _top_n(df: pd.DataFrame, partner_type: str, n: int = 15) -> pd.DataFrame:
-        sub = df[df[PARTNER_TYPE_COL] == partner_type].copy()
+    def _top_n(partner_type: str, n: int = 15) -> pd.DataFrame:
+        sub = prospects[prospects[PARTNER_TYPE_COL] == partner_type]
         if sub.empty:
             return sub
-        return sub.sort_values(EXPECTED_COL, ascending=False).head(n)
+        # Heap selection: O(N log n) versus sorting the whole slice.
+        return sub.nlargest(n, EXPECTED_COL)
 
     left, right = st.columns(2)
 
     with left:
-        _render_deal_panel(_top_n(prospects, "Sponsorship"), "Top Sponsorship Deals")
+        _render_deal_panel(_top_n("Sponsorship"), "Top Sponsorship Deals")
 
     with right:
-        _render_deal_panel(_top_n(prospects, "Public Investment"), "Top Public Investment Deals")
+        _render_deal_panel(_top_n("Public Investment"), "Top Public Investment Deals")
 
 
 def build_pipeline_board(prospects: pd.DataFrame) -> None:
@@ -1441,7 +1591,7 @@ def build_pipeline_board(prospects: pd.DataFrame) -> None:
             unsafe_allow_html=True,
         )
 
-        df = prospects[prospects["Stage Bucket"] != "Dead"].copy()
+        df = prospects.loc[prospects["Stage Bucket"] != "Dead"]
         if df.empty:
             st.caption("No active prospects in the pipeline.")
             return
@@ -1452,7 +1602,7 @@ def build_pipeline_board(prospects: pd.DataFrame) -> None:
 
         for label, tab in zip(tab_labels, tabs):
             with tab:
-                subset = df.copy() if label == "All" else df[df[PARTNER_TYPE_COL] == label].copy()
+                subset = df if label == "All" else df[df[PARTNER_TYPE_COL] == label]
 
                 if subset.empty:
                     st.caption("No deals in this segment yet.")
@@ -1462,7 +1612,7 @@ def build_pipeline_board(prospects: pd.DataFrame) -> None:
 
                 for col, stage in zip(cols, STAGE_ORDER):
                     with col:
-                        stage_df = subset[subset["Stage Bucket"] == stage].copy()
+                        stage_df = subset[subset["Stage Bucket"] == stage]
 
                         cols_to_show = [
                             "Prospect (Account Name)",
@@ -1486,13 +1636,16 @@ def build_pipeline_board(prospects: pd.DataFrame) -> None:
                         if stage_df.empty:
                             st.caption("No deals at this stage.")
                         else:
+                            # Pre-format the money columns to strings rather
+                            # than paying the Styler's Jinja render per table.
+                            money_cols = [
+                                c
+                                for c in (CURRENT_INVESTMENT_COL, CONTRACTED_COL, EXPECTED_COL)
+                                if c in stage_df.columns
+                            ]
                             st.dataframe(
-                                stage_df.style.format(
-                                    {
-                                        CURRENT_INVESTMENT_COL: "${:,.0f}",
-                                        CONTRACTED_COL: "${:,.0f}",
-                                        EXPECTED_COL: "${:,.0f}",
-                                    }
+                                stage_df.assign(
+                                    **{c: stage_df[c].map(format_currency) for c in money_cols}
                                 ),
                                 hide_index=True,
                                 use_container_width=True,
@@ -1565,9 +1718,10 @@ def main() -> None:
             LAST_UPLOAD_PATH.unlink()
         st.rerun()
 
-    # Load from saved bytes instead of directly from uploaded
+    # Load from saved bytes instead of directly from uploaded; the bytes key
+    # lets st.cache_data skip re-parsing the workbook on every rerun.
     prospects, _, _, key_conversations, bizx_details = load_workbook(
-        io.BytesIO(st.session_state.workbook_bytes)
+        st.session_state.workbook_bytes
     )
 
     st.sidebar.header("Filters")
@@ -1590,13 +1744,27 @@ def main() -> None:
             options=owner_options,
             default=owner_options,
         )
-        mask_owner = prospects["Owner"].isin(selected_owners)
     else:
-        mask_owner = True
-
-    filtered_prospects = prospects[
-        prospects[PARTNER_TYPE_COL].isin(selected_partner_types) & mask_owner
-    ].copy()
+        owner_options = []
+        selected_owners = []
+
+    # Stable key for the derived-frame caches: workbook contents plus the
+    # sorted filter selections.
+    workbook_digest = hashlib.sha1(st.session_state.workbook_bytes).hexdigest()
+    partner_key = tuple(sorted(selected_partner_types))
+    owners_key = tuple(sorted(selected_owners)) if "Owner" in prospects.columns else None
+    filter_key = (workbook_digest, partner_key, owners_key)
+
+    # Fast path for the default all-selected state: skip mask construction and
+    # reuse the cached frame as-is. Rows with a blank Owner have always been
+    # excluded by the isin mask, so they keep going through the mask path.
+    owners_all = "Owner" not in prospects.columns or (
+        set(selected_owners) == set(owner_options) and not prospects["Owner"].isna().any()
+    )
+    if owners_all and set(selected_partner_types) == set(partner_types):
+        filtered_prospects = prospects
+    else:
+        filtered_prospects = _apply_filters(prospects, workbook_digest, partner_key, owners_key)
 
     if filtered_prospects.empty:
         st.warning("No deals match the selected filters.")
@@ -1611,7 +1779,7 @@ def main() -> None:
     build_snapshot_section(filtered_prospects)
     st.divider()
 
-    build_pipeline_totals(filtered_prospects)
+    build_pipeline_totals(filtered_prospects, filter_key)
     st.divider()
 
     build_top_deals(filtered_prospects)